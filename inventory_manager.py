@@ -12,53 +12,154 @@ Features:
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt # type: ignore
-import seaborn as sns # type: ignore
+from pandas.api.types import union_categoricals
 from datetime import datetime
 import numpy as np
 import os
 
+try:
+    import pyarrow as pa # type: ignore
+    import pyarrow.csv as pacsv # type: ignore
+except ImportError:  # Optional - falls back to pandas' CSV writer
+    pa = None
+
+# Expected inventory columns (normalized names) and the dtypes they are parsed as
+INVENTORY_DTYPES = {
+    'product_name': 'string',
+    'category': 'string',
+    'current_stock': 'Int32',
+    'price': 'float32',
+    'supplier': 'string',
+    'last_updated': 'string'
+}
+
+# Parsed as text, then encoded: the parser's own categorical merge fails on blank blocks
+CATEGORICAL_COLUMNS = ('category', 'supplier')
+
+# Seaborn's six colour "husl" palette, so charts keep their look without importing seaborn
+CHART_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+def _write_csv(df, filename):
+    """Write a DataFrame to CSV, using PyArrow's multi-threaded writer when available"""
+    # Arrow quotes every header and text field; the pandas fallback quotes only where needed
+    if pa is None:
+        df.to_csv(filename, index=False)
+        return
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    write_options = pacsv.WriteOptions(include_header=True, quoting_style='needed')
+    pacsv.write_csv(table, filename, write_options=write_options)
+
+def _suggest_reorder(stock, price):
+    """Return suggested reorder quantities and their estimated cost"""
+    quantity = np.maximum(50 - stock, 20)
+    return quantity, np.multiply(quantity, price, dtype=np.float32)
+
 class InventoryManager:
     def __init__(self):
         self.df = None
-        self.low_stock_threshold = 20
+        self._low_stock_threshold = 20
         self.reorder_days = 30
         
-    def load_inventory_data(self, csv_file):
-        """Load and validate inventory data from CSV file"""
+        # Low stock selection shared by the alert, chart and reorder report
+        self._low_mask = None
+        self._low_sorted_idx = None
+        self._category_stats = None
+    
+    @property
+    def low_stock_threshold(self):
+        return self._low_stock_threshold
+    
+    @low_stock_threshold.setter
+    def low_stock_threshold(self, value):
+        self._low_stock_threshold = value
+        self._low_mask = None
+        
+    def load_inventory_data(self, csv_file, chunksize=200_000):
+        """Load and validate inventory data from CSV file, streaming it in chunks"""
+        self._low_mask = None
+        self._category_stats = None
         try:
-            self.df = pd.read_csv(csv_file)
-            print(f"✅ Loaded {len(self.df)} products from {csv_file}")
+            # File-like inputs are read more than once, so remember where they start
+            start = csv_file.tell() if hasattr(csv_file, 'seek') else None
             
-            # Clean and standardize data
-            self.df.columns = self.df.columns.str.strip().str.lower().str.replace(' ', '_')
+            # Sniff the header so the full read only parses the columns we use
+            header = pd.read_csv(csv_file, nrows=0).columns
+            columns = dict(zip(header, header.str.strip().str.lower().str.replace(' ', '_')))
             
             # Ensure required columns exist
             required_cols = ['product_name', 'current_stock', 'price', 'category']
-            missing_cols = [col for col in required_cols if col not in self.df.columns]
+            missing_cols = [col for col in required_cols if col not in columns.values()]
             
             if missing_cols:
                 print(f"⚠️  Missing columns: {missing_cols}")
-                print("Available columns:", list(self.df.columns))
+                print("Available columns:", list(columns.values()))
                 return False
-                
-            # Clean data types
-            self.df['current_stock'] = pd.to_numeric(self.df['current_stock'], errors='coerce').fillna(0)
-            self.df['price'] = pd.to_numeric(self.df['price'], errors='coerce').fillna(0)
             
-            # Calculate inventory value
-            self.df['inventory_value'] = self.df['current_stock'] * self.df['price']
+            # Parse straight into the final dtypes instead of coercing afterwards
+            usecols = [raw for raw, col in columns.items() if col in INVENTORY_DTYPES]
+            dtype = {raw: INVENTORY_DTYPES[columns[raw]] for raw in usecols}
+            try:
+                self.df = self._read_inventory(csv_file, start, columns, dtype, chunksize)
+            except ValueError:
+                # Dirty numbers: read them as text and let bad cells count as zero
+                dtype.update({raw: 'string' for raw in usecols
+                              if columns[raw] in ('current_stock', 'price')})
+                self.df = self._read_inventory(csv_file, start, columns, dtype, chunksize)
             
+            print(f"✅ Loaded {len(self.df)} products from {csv_file}")
             return True
             
         except Exception as e:
             print(f"❌ Error loading data: {e}")
             return False
     
+    def _read_inventory(self, csv_file, start, columns, dtype, chunksize):
+        """Read the inventory columns with the given dtypes and prepare them"""
+        if start is not None:
+            csv_file.seek(start)
+        read_options = dict(usecols=list(dtype), dtype=dtype, na_values=[''], engine='c')
+        
+        if chunksize is None:
+            return self._prepare_inventory(pd.read_csv(csv_file, **read_options), columns)
+        
+        # Parse and clean one chunk at a time, then join the cleaned chunks
+        with pd.read_csv(csv_file, chunksize=chunksize, **read_options) as reader:
+            parts = [self._prepare_inventory(chunk, columns) for chunk in reader]
+        
+        # Chunks carry different categories and would concatenate as strings, so
+        # union the categorical columns separately
+        categorical = [col for col in CATEGORICAL_COLUMNS if col in parts[0].columns]
+        df = pd.concat([part.drop(columns=categorical) for part in parts], ignore_index=True)
+        for col in categorical:
+            df[col] = union_categoricals([part[col] for part in parts])
+        return df[parts[0].columns]
+    
+    def _prepare_inventory(self, df, columns):
+        """Standardize column names, clean numbers and add inventory value"""
+        df = df.rename(columns=columns)
+        
+        # Numbers read as text after a parse error: unparseable cells become missing
+        if not pd.api.types.is_numeric_dtype(df['current_stock']):
+            df['current_stock'] = pd.to_numeric(df['current_stock'], errors='coerce').round().astype('Int32')
+        if not pd.api.types.is_numeric_dtype(df['price']):
+            df['price'] = pd.to_numeric(df['price'], errors='coerce').astype('float32')
+        
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        # Missing numbers count as zero
+        df[['current_stock', 'price']] = df[['current_stock', 'price']].fillna(0)
+        
+        # Calculate inventory value in float64 from prices rounded back to cents, so money
+        # totals stay exact even though price itself is stored as float32
+        price = np.round(df['price'].to_numpy(dtype=np.float64), 2)
+        df['inventory_value'] = df['current_stock'].to_numpy(dtype=np.float64) * price
+        
+        return df
+    
     def generate_sample_data(self, filename="sample_inventory.csv", num_products=50):
         """Generate realistic sample inventory data for demonstration"""
-        np.random.seed(42)  # For consistent demo data
-        
         # Create logical product-category pairs
         product_categories = [
             ('Wireless Headphones', 'Electronics'), ('Smartphone Case', 'Electronics'), 
@@ -75,66 +176,77 @@ class InventoryManager:
             ('Makeup Brush', 'Beauty'), ('Perfume', 'Beauty')
         ]
         
-        # Generate sample data with correct category matching
-        data = []
-        for i in range(num_products):
-            # Select a random product-category pair
-            product_name, category = product_categories[i % len(product_categories)]
-            
-            # Add variety to make each product unique but realistic
-            if category == 'Electronics':
-                product_name = f"{product_name} - {['Black', 'White', 'Silver', 'Blue'][i % 4]}"
-            elif category == 'Clothing':
-                product_name = f"{product_name} - Size {['S', 'M', 'L', 'XL'][i % 4]}"
-            elif category == 'Sports':
-                product_name = f"{product_name} - {['Pro', 'Standard', 'Premium', 'Basic'][i % 4]}"
-            elif category == 'Beauty':
-                if 'Brush' in product_name:
-                    product_name = f"{product_name} - {['Small', 'Medium', 'Large', 'Travel'][i % 4]}"
-                else:  # For liquids like shampoo, perfume, face cream
-                    product_name = f"{product_name} - {['50ml', '100ml', '150ml', '200ml'][i % 4]}"
-            elif category == 'Books':
-                product_name = f"{product_name} - {['Hardcover', 'Paperback', 'Large Print', 'Deluxe'][i % 4]}"
-            else:  # Home & Garden
-                product_name = f"{product_name} - {['Small', 'Medium', 'Large', 'Extra Large'][i % 4]}"
-            
-            current_stock = np.random.randint(0, 200)
-            price = round(np.random.uniform(5.99, 299.99), 2)
-            supplier = f"Supplier_{np.random.randint(1, 10)}"
-            
-            data.append({
-                'Product Name': product_name,
-                'Category': category,
-                'Current Stock': current_stock,
-                'Price': price,
-                'Supplier': supplier,
-                'Last Updated': datetime.now().strftime('%Y-%m-%d')
-            })
-        
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+        # Variants that make each product unique but realistic
+        category_variants = {
+            'Electronics': ['Black', 'White', 'Silver', 'Blue'],
+            'Clothing': ['Size S', 'Size M', 'Size L', 'Size XL'],
+            'Sports': ['Pro', 'Standard', 'Premium', 'Basic'],
+            'Beauty': ['50ml', '100ml', '150ml', '200ml'],  # For liquids like shampoo, perfume, face cream
+            'Books': ['Hardcover', 'Paperback', 'Large Print', 'Deluxe'],
+            'Home & Garden': ['Small', 'Medium', 'Large', 'Extra Large']
+        }
+        brush_variants = ['Small', 'Medium', 'Large', 'Travel']
+        variant_table = np.array([brush_variants if 'Brush' in name else category_variants[category]
+                                  for name, category in product_categories])
+        
+        # Generate every column in one batch with correct category matching
+        base_names = np.array([name for name, _ in product_categories])
+        categories = np.array([category for _, category in product_categories])
+        idx = np.arange(num_products)
+        pair = idx % len(product_categories)
+        product_names = np.char.add(np.char.add(base_names[pair], ' - '), variant_table[pair, idx % 4])
+        
+        rng = np.random.default_rng(42)  # For consistent demo data
+        current_stock = rng.integers(0, 200, num_products, dtype=np.int32)
+        price = np.round(rng.uniform(5.99, 299.99, num_products), 2)
+        supplier_ids = rng.integers(1, 10, num_products)
+        supplier = np.char.add('Supplier_', supplier_ids.astype('U1'))  # IDs are single digits
+        
+        df = pd.DataFrame({
+            'Product Name': product_names,
+            'Category': categories[pair],
+            'Current Stock': current_stock,
+            'Price': price,
+            'Supplier': supplier,
+            'Last Updated': datetime.now().strftime('%Y-%m-%d')
+        })
+        _write_csv(df, filename)
         print(f"📊 Generated sample data: {filename}")
         return filename
     
+    def _low_stock_rows(self):
+        """Return the cached low stock mask and row positions sorted by stock"""
+        if self._low_mask is None:
+            stock = self.df['current_stock'].to_numpy()
+            self._low_mask = stock <= self.low_stock_threshold
+            positions = np.flatnonzero(self._low_mask)
+            self._low_sorted_idx = positions[np.argsort(stock[positions], kind='stable')]
+        return self._low_mask, self._low_sorted_idx
+    
     def analyze_low_stock(self):
         """Identify products that need reordering"""
         if self.df is None:
             print("❌ No data loaded. Please load inventory data first.")
             return None
             
-        low_stock = self.df[self.df['current_stock'] <= self.low_stock_threshold].copy()
-        low_stock = low_stock.sort_values('current_stock')
+        _, sorted_idx = self._low_stock_rows()
+        low_stock = self.df.iloc[sorted_idx]
         
         print(f"\n🚨 LOW STOCK ALERT - {len(low_stock)} products need attention:")
         print("="*60)
         
         if len(low_stock) > 0:
-            for _, product in low_stock.iterrows():
-                urgency = "🔴 CRITICAL" if product['current_stock'] <= 5 else "🟡 LOW"
-                print(f"{urgency} {product['product_name']}")
-                print(f"   Stock: {product['current_stock']} | Value: ${product['inventory_value']:.2f}")
-                print(f"   Category: {product['category']}")
-                print("-" * 40)
+            # Pull each column out once and build the whole alert in a single write
+            names = low_stock['product_name'].to_numpy()
+            stock = low_stock['current_stock'].to_numpy()
+            value = low_stock['inventory_value'].to_numpy()
+            category = low_stock['category'].to_numpy()
+            urgency = np.where(stock <= 5, "🔴 CRITICAL", "🟡 LOW")
+            
+            print("\n".join(
+                f"{u} {n}\n   Stock: {s} | Value: ${v:.2f}\n   Category: {c}\n" + "-" * 40
+                for u, n, s, v, c in zip(urgency, names, stock, value, category)
+            ))
         else:
             print("✅ All products have adequate stock levels!")
             
@@ -145,71 +257,87 @@ class InventoryManager:
         if self.df is None:
             return None
             
-        category_stats = self.df.groupby('category').agg({
-            'current_stock': ['sum', 'count', 'mean'],
-            'inventory_value': ['sum', 'mean'],
-            'price': 'mean'
-        }).round(2)
-        
-        category_stats.columns = ['Total_Stock', 'Product_Count', 'Avg_Stock', 
-                                'Total_Value', 'Avg_Value', 'Avg_Price']
+        # Named aggregations give the report columns directly, no MultiIndex to flatten
+        grouped = self.df.groupby('category', sort=False, observed=True)
+        category_stats = grouped.agg(
+            Total_Stock=('current_stock', 'sum'),
+            Product_Count=('current_stock', 'size'),
+            Avg_Stock=('current_stock', 'mean'),
+            Total_Value=('inventory_value', 'sum'),
+            Avg_Value=('inventory_value', 'mean'),
+            Avg_Price=('price', 'mean')
+        ).astype({'Avg_Price': 'float64'}).round(2)  # float32 mean would not round to cents
         
         print("\n📊 INVENTORY BY CATEGORY:")
         print("="*80)
-        print(category_stats.to_string())
+        print(category_stats.to_string(float_format='{:.2f}'.format))
         
+        self._category_stats = category_stats
         return category_stats
     
     def create_visual_reports(self, output_dir="inventory_reports"):
         """Generate visual reports and charts"""
         if self.df is None:
             return False
+        
+        # Imported here so runs that skip the charts never load matplotlib. Figures are
+        # rendered on their own Agg canvas, leaving pyplot and the caller's backend alone.
+        import matplotlib # type: ignore
+        import matplotlib.style # type: ignore
+        from matplotlib.figure import Figure # type: ignore
+        from matplotlib.backends.backend_agg import FigureCanvasAgg # type: ignore
             
         os.makedirs(output_dir, exist_ok=True)
         
-        # Set style for professional charts
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
-        
-        # 1. Stock Levels by Category
-        plt.figure(figsize=(12, 6))
-        category_stock = self.df.groupby('category')['current_stock'].sum()
-        plt.subplot(1, 2, 1)
-        category_stock.plot(kind='bar', color='skyblue')
-        plt.title('Total Stock by Category', fontsize=14, fontweight='bold')
-        plt.xlabel('Category')
-        plt.ylabel('Total Stock')
-        plt.xticks(rotation=45)
-        
-        # 2. Inventory Value Distribution
-        plt.subplot(1, 2, 2)
-        category_value = self.df.groupby('category')['inventory_value'].sum()
-        plt.pie(category_value.values, labels=category_value.index, autopct='%1.1f%%')
-        plt.title('Inventory Value Distribution', fontsize=14, fontweight='bold')
-        
-        plt.tight_layout()
-        plt.savefig(f'{output_dir}/category_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        # 3. Low Stock Alert Chart
-        low_stock = self.df[self.df['current_stock'] <= self.low_stock_threshold]
-        if len(low_stock) > 0:
-            plt.figure(figsize=(10, 6))
-            low_stock_sorted = low_stock.sort_values('current_stock').head(10)
-            plt.barh(range(len(low_stock_sorted)), low_stock_sorted['current_stock'], 
-                    color='red', alpha=0.7)
-            plt.yticks(range(len(low_stock_sorted)), 
-                      [name[:30] + '...' if len(name) > 30 else name 
-                       for name in low_stock_sorted['product_name']])
-            plt.xlabel('Current Stock')
-            plt.title('Top 10 Products Needing Restock', fontsize=14, fontweight='bold')
-            plt.axvline(x=self.low_stock_threshold, color='orange', linestyle='--', 
-                       label=f'Reorder Threshold ({self.low_stock_threshold})')
-            plt.legend()
-            plt.tight_layout()
-            plt.savefig(f'{output_dir}/low_stock_alert.png', dpi=300, bbox_inches='tight')
-            plt.close()
-        
+        # Reuse the totals from category_analysis rather than grouping again
+        if self._category_stats is not None:
+            category_stock = self._category_stats['Total_Stock']
+            category_value = self._category_stats['Total_Value']
+        else:
+            grouped = self.df.groupby('category', sort=False, observed=True)
+            category_stock = grouped['current_stock'].sum()
+            category_value = grouped['inventory_value'].sum()
+        
+        # Set style for professional charts, scoped so the global rcParams stay untouched
+        chart_style = ['seaborn-v0_8', {'axes.prop_cycle': matplotlib.cycler(color=CHART_PALETTE)}]
+        with matplotlib.style.context(chart_style):
+            # 1. Stock Levels by Category
+            fig = Figure(figsize=(12, 6))
+            FigureCanvasAgg(fig)
+            axes = fig.subplots(1, 2)
+            axes[0].bar(category_stock.index.astype(str), category_stock.values, color='skyblue')
+            axes[0].set_title('Total Stock by Category', fontsize=14, fontweight='bold')
+            axes[0].set_xlabel('Category')
+            axes[0].set_ylabel('Total Stock')
+            axes[0].tick_params(axis='x', rotation=45)
+            
+            # 2. Inventory Value Distribution
+            axes[1].pie(category_value.values, labels=category_value.index.astype(str), autopct='%1.1f%%')
+            axes[1].set_title('Inventory Value Distribution', fontsize=14, fontweight='bold')
+            
+            fig.tight_layout()
+            fig.savefig(f'{output_dir}/category_analysis.png', dpi=150, bbox_inches='tight')
+            
+            # 3. Low Stock Alert Chart
+            _, sorted_idx = self._low_stock_rows()
+            if len(sorted_idx) > 0:
+                fig = Figure(figsize=(10, 6))
+                FigureCanvasAgg(fig)
+                ax = fig.subplots()
+                low_stock_sorted = self.df.iloc[sorted_idx[:10]]
+                ax.barh(range(len(low_stock_sorted)), low_stock_sorted['current_stock'], 
+                        color='red', alpha=0.7)
+                names = low_stock_sorted['product_name'].to_numpy(dtype=str)
+                labels = np.where(np.char.str_len(names) > 30, np.char.add(names.astype('U30'), '...'), names)
+                ax.set_yticks(range(len(low_stock_sorted)), labels)
+                ax.set_xlabel('Current Stock')
+                ax.set_title('Top 10 Products Needing Restock', fontsize=14, fontweight='bold')
+                ax.axvline(x=self.low_stock_threshold, color='orange', linestyle='--', 
+                           label=f'Reorder Threshold ({self.low_stock_threshold})')
+                ax.legend()
+                fig.tight_layout()
+                fig.savefig(f'{output_dir}/low_stock_alert.png', dpi=150, bbox_inches='tight')
+            
         print(f"📈 Visual reports saved to '{output_dir}/' directory")
         return True
     
@@ -218,31 +346,38 @@ class InventoryManager:
         if self.df is None:
             return False
             
-        low_stock = self.df[self.df['current_stock'] <= self.low_stock_threshold].copy()
+        # Gather only the columns the report needs, in a single pass
+        low_mask, _ = self._low_stock_rows()
+        low_stock = self.df.loc[low_mask, ['product_name', 'category', 'current_stock', 'price']]
         
         # Calculate suggested reorder quantities
-        low_stock['suggested_reorder'] = np.maximum(50 - low_stock['current_stock'], 20)
-        low_stock['estimated_cost'] = low_stock['suggested_reorder'] * low_stock['price']
-        
-        # Select and rename columns for the report
-        reorder_report = low_stock[['product_name', 'category', 'current_stock', 
-                                  'suggested_reorder', 'price', 'estimated_cost']].copy()
-        
-        reorder_report.columns = ['Product', 'Category', 'Current_Stock', 
-                                'Suggested_Reorder', 'Unit_Price', 'Estimated_Cost']
-        
-        # Add totals row
+        quantity, cost = _suggest_reorder(low_stock['current_stock'].to_numpy(np.int32),
+                                          low_stock['price'].to_numpy(np.float32))
+        
+        reorder_report = pd.DataFrame({
+            'Product': low_stock['product_name'],
+            'Category': low_stock['category'],
+            'Current_Stock': low_stock['current_stock'],
+            'Suggested_Reorder': quantity,
+            'Unit_Price': low_stock['price'],
+            'Estimated_Cost': cost
+        })
+        
+        # Report money in cents rather than float32 artefacts
+        money_cols = ['Unit_Price', 'Estimated_Cost']
+        reorder_report[money_cols] = reorder_report[money_cols].astype('float64').round(2)
+        
+        # Keep totals alongside the report so its columns stay numeric
         totals = {
-            'Product': 'TOTAL',
-            'Category': '',
-            'Current_Stock': '',
-            'Suggested_Reorder': reorder_report['Suggested_Reorder'].sum(),
-            'Unit_Price': '',
-            'Estimated_Cost': reorder_report['Estimated_Cost'].sum()
+            'Suggested_Reorder': int(reorder_report['Suggested_Reorder'].sum()),
+            'Estimated_Cost': float(reorder_report['Estimated_Cost'].sum())
         }
-        reorder_report = pd.concat([reorder_report, pd.DataFrame([totals])], ignore_index=True)
+        reorder_report.attrs['totals'] = totals
         
-        reorder_report.to_csv(output_file, index=False)
+        _write_csv(reorder_report, output_file)
+        label = '"TOTAL"' if pa is not None else 'TOTAL'  # Quote like the writer above
+        with open(output_file, 'a') as f:
+            f.write(f"{label},,,{totals['Suggested_Reorder']},,{totals['Estimated_Cost']:.2f}\n")
         print(f"📋 Reorder report saved: {output_file}")
         print(f"💰 Total estimated reorder cost: ${totals['Estimated_Cost']:.2f}")
         
@@ -266,8 +401,8 @@ class InventoryManager:
         
         # Analyze low stock and use the results
         low_stock_items = self.analyze_low_stock()
-        critical_items = low_stock_items[low_stock_items['current_stock'] <= 5]
-        print(f"🔴 Critical stock items (≤5 units): {len(critical_items)}")
+        critical_count = np.count_nonzero(low_stock_items['current_stock'].to_numpy() <= 5)
+        print(f"🔴 Critical stock items (≤5 units): {critical_count}")
         
         # Category analysis and use the results  
         category_stats = self.category_analysis()
@@ -281,10 +416,10 @@ class InventoryManager:
         reorder_report = self.generate_reorder_report()
         
         # Extract insights from reorder report
-        if len(reorder_report) > 1:  # Has data beyond totals row
-            total_items_to_reorder = len(reorder_report) - 1
-            total_reorder_cost = reorder_report.iloc[-1]['Estimated_Cost']
-            avg_reorder_cost = reorder_report[:-1]['Estimated_Cost'].mean()  # Exclude totals row
+        if len(reorder_report) > 0:
+            total_items_to_reorder = len(reorder_report)
+            total_reorder_cost = reorder_report.attrs['totals']['Estimated_Cost']
+            avg_reorder_cost = reorder_report['Estimated_Cost'].mean()
             
             print("\n💰 REORDER ANALYSIS:")
             print(f"Items needing reorder: {total_items_to_reorder}")
@@ -349,9 +484,9 @@ def main():
         reorder_report = manager.generate_reorder_report()
         
         # Use the reorder report data
-        if len(reorder_report) > 1:  # Has data beyond totals row
-            items_to_reorder = len(reorder_report) - 1
-            total_cost = reorder_report.iloc[-1]['Estimated_Cost']
+        if len(reorder_report) > 0:
+            items_to_reorder = len(reorder_report)
+            total_cost = reorder_report.attrs['totals']['Estimated_Cost']
             print(f"Reorder report: {items_to_reorder} items need restocking")
             print(f"Total reorder cost: ${total_cost:.2f}")
         else: